@@ -13,6 +13,7 @@ mimetypes.add_type('application/javascript', '.mjs')
 import flask
 from flask import Flask, request, send_from_directory, session
 from flask import stream_with_context, Response
+from flask_compress import Compress
 
 import webbrowser
 import threading
@@ -50,6 +51,16 @@ app.json.sort_keys = False
 # The limiter is defined in demo_stream_routes.py to avoid circular imports
 demo_stream_limiter.init_app(app)
 
+# Compress responses for clients that accept it (CSV demo feeds shrink 5-10x).
+# Streamed responses are left alone so agent progress still arrives incrementally.
+app.config['COMPRESS_MIMETYPES'] = [
+    'text/html', 'text/css', 'text/xml', 'text/csv',
+    'application/json', 'application/javascript',
+]
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_STREAMS'] = False
+Compress(app)
+
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, np.int64):
@@ -22,17 +22,28 @@ Rate Limiting:
 - Limits are set per IP address using Flask-Limiter
 """
 
-import random
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import io
 import csv
-import math
-from datetime import datetime, timedelta
-from flask import Blueprint, Response, request, jsonify
-from typing import List, Dict, Any, Optional
+import time
+import hashlib
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import ijson
+import orjson
+import pandas as pd
+from flask import Blueprint, Response, request, make_response
+from functools import wraps, lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
 from collections import deque
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import threading
+import contextvars
 
 logger = logging.getLogger(__name__)
 
@@ -73,14 +84,72 @@ YFINANCE_RATE_LIMIT = "10 per minute"
 # Simulated/mock data - no external calls, more generous
 MOCK_RATE_LIMIT = "60 per minute"
 
+# HTTP cache lifetimes (seconds) advertised via Cache-Control, matching each
+# endpoint's recommended refresh interval
+ISS_CACHE_TTL = 5
+EARTHQUAKE_CACHE_TTL = 60
+WEATHER_CACHE_TTL = 300
+WEATHER_HISTORY_CACHE_TTL = 3600
+WEATHER_FORECAST_CACHE_TTL = 3600
+YFINANCE_HISTORY_CACHE_TTL = 3600
+YFINANCE_RECENT_CACHE_TTL = 300
+YFINANCE_FINANCIALS_CACHE_TTL = 3600
+LIVE_SALES_CACHE_TTL = 1
+
 # Try to import yfinance
 import yfinance as yf
 
+# Shared HTTP session for all upstream APIs. Keeps TCP/TLS connections alive
+# between calls (and across requests) instead of handshaking on every GET, and
+# retries transient upstream failures with a short backoff.
+_HTTP = requests.Session()
+_HTTP.headers.update({
+    'User-Agent': 'DataFormulator (https://github.com/microsoft/data-formulator)',
+    # Advertise every encoding urllib3 can decode: gzip/deflate, plus br when brotli is
+    # installed. USGS GeoJSON and Open-Meteo JSON shrink 5-10x on the wire.
+    'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+})
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    # read=False: a read timeout is not retried. respect_retry_after_header=False: a 429/503
+    # is retried after the short backoff below rather than sleeping for whatever Retry-After
+    # the upstream sends, which would hold the calling thread regardless of its timeout.
+    max_retries=Retry(total=2, read=False, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504],
+                      respect_retry_after_header=False),
+)
+_HTTP.mount('https://', _HTTP_ADAPTER)
+_HTTP.mount('http://', _HTTP_ADAPTER)
+
+# Shared worker pool for fanning out upstream HTTP calls within a request.
+# The work is pure network I/O (the GIL is released while waiting on sockets),
+# so a handful of threads turns N sequential round-trips into ~1.
+_IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="demo-stream-io")
+
+
+def _io_map(fn, items, pool: ThreadPoolExecutor = _IO_POOL):
+    """
+    pool.map that runs each call in a copy of the caller's context, so request-scoped
+    context variables (the stale and degraded response markers) reach the workers.
+    """
+    items = list(items)
+    contexts = [contextvars.copy_context() for _ in items]
+    return pool.map(lambda ctx, item: ctx.run(fn, item), contexts, items)
+
+# Yahoo throttles aggressive clients, so per-symbol yfinance calls (ticker.info
+# has no batch API) get their own, smaller pool and never starve the weather fan-out
+_YF_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="demo-stream-yf")
+
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+def _json_body(response: requests.Response) -> Any:
+    """Decode an upstream JSON response body with orjson (faster than response.json() on large payloads)"""
+    return orjson.loads(response.content)
+
+
 def make_csv_response(rows: list, filename: str = "data.csv") -> Response:
     """Convert list of dicts to CSV text response"""
     if not rows:
@@ -98,26 +167,404 @@ def make_csv_response(rows: list, filename: str = "data.csv") -> Response:
     )
 
 
+def make_csv_response_rows(columns: Tuple[str, ...], rows: list) -> Response:
+    """Convert row tuples (in `columns` order) to CSV text response, skipping per-row dicts"""
+    if not rows:
+        return Response("", mimetype='text/csv')
+    
+    # Encode into a bytes buffer as rows are written, like make_csv_response_df, rather than
+    # building the whole str and having Flask encode a second copy of it
+    output = io.BytesIO()
+    text = io.TextIOWrapper(output, encoding="utf-8", newline="")
+    writer = csv.writer(text)
+    writer.writerow(columns)
+    writer.writerows(rows)
+    text.flush()
+    body = output.getvalue()
+    text.detach()
+    
+    return Response(
+        body,
+        mimetype='text/csv',
+        headers={'Access-Control-Allow-Origin': '*'}
+    )
+
+
+def make_csv_response_df(df: pd.DataFrame) -> Response:
+    """Convert a DataFrame to CSV text response (same format as make_csv_response)"""
+    if df.empty:
+        return Response("", mimetype='text/csv')
+    
+    # Encode straight into a bytes buffer so large frames never hold a full str copy as well.
+    # The body stays buffered (not streamed) so Flask-Compress and the ETag/304 path still apply.
+    output = io.BytesIO()
+    df.to_csv(output, index=False, lineterminator="\r\n", encoding="utf-8")
+    
+    return Response(
+        output.getvalue(),
+        mimetype='text/csv',
+        headers={'Access-Control-Allow-Origin': '*'}
+    )
+
+
+# ETags of recently served responses, keyed by request path + query string.
+# Lets a conditional request be answered with 304 before the view runs.
+_etag_lock = threading.Lock()
+_etag_index: Dict[str, Tuple[float, str]] = {}  # full_path -> (expires_at monotonic, etag)
+_ETAG_INDEX_MAX_ENTRIES = 256
+
+
+def http_cache(ttl: int):
+    """
+    Decorator adding Cache-Control and ETag headers to a route's 200 responses.
+    
+    Browsers and CDNs may reuse the response for `ttl` seconds. Within that window a
+    request whose If-None-Match matches the last ETag served for the same URL gets a
+    304 without calling the view, so no upstream fetch or CSV build happens.
+    """
+    cache_control = f"public, max-age={ttl}, stale-while-revalidate={max(1, ttl // 2)}"
+    
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = request.full_path
+            
+            if request.if_none_match:
+                with _etag_lock:
+                    entry = _etag_index.get(key)
+                if entry and entry[0] > time.monotonic() and request.if_none_match.contains_weak(entry[1]):
+                    response = Response(status=304, headers={'Access-Control-Allow-Origin': '*'})
+                    response.set_etag(entry[1], weak=True)
+                    response.headers['Cache-Control'] = cache_control
+                    return response
+            
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            
+            body = None if response.is_streamed else response.get_data()
+            if served_stale() or served_degraded() or (body is not None and not _has_data_rows(body)):
+                # Built from a fallback copy, missing rows after an upstream error, or empty;
+                # don't let clients or the ETag index hold on to it past this request
+                response.headers['Cache-Control'] = 'no-cache'
+                return response
+            
+            response.headers['Cache-Control'] = cache_control
+            if body is None:
+                return response
+            
+            # Weak, because Flask-Compress rewrites strong ETags to "<etag>:gzip" and clients
+            # would echo back a value the index above never matches; weak ones pass through
+            etag = hashlib.md5(body, usedforsecurity=False).hexdigest()
+            response.set_etag(etag, weak=True)
+            with _etag_lock:
+                if len(_etag_index) >= _ETAG_INDEX_MAX_ENTRIES:
+                    now = time.monotonic()
+                    for stale_key in [k for k, (expires_at, _) in _etag_index.items() if expires_at <= now]:
+                        del _etag_index[stale_key]
+                    if len(_etag_index) >= _ETAG_INDEX_MAX_ENTRIES:
+                        _etag_index.clear()
+                _etag_index[key] = (time.monotonic() + ttl, etag)
+            
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+
+def _has_data_rows(body: bytes) -> bool:
+    """Whether a CSV body has anything past its header line"""
+    header_end = body.find(b"\n")
+    return header_end != -1 and header_end < len(body) - 1
+
+
+# In-process cache of upstream JSON responses, keyed by URL + query params.
+# The upstream feeds update on minute-to-hour cadences, so repeated client
+# refreshes within a TTL are served from memory instead of re-fetching. Once an
+# entry expires it is revalidated with If-None-Match / If-Modified-Since, so an
+# unchanged feed costs a 304 instead of a full download.
+_resp_cache_lock = threading.Lock()
+_resp_cache: Dict[tuple, Dict[str, Any]] = {}  # (url, params) -> {expires_at, data, etag, last_modified}
+_RESP_CACHE_MAX_ENTRIES = 256
+
+# How long past expiry a cached copy may still be served when the upstream fails
+STALE_IF_ERROR_MAX_AGE = 6 * 3600
+
+# Per-request list of upstream URLs answered from a stale copy. Set by the
+# before_request hook; responses built from stale data get an X-Cache: STALE header.
+_stale_marker: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "demo_stream_stale_marker", default=None
+)
+
+
+# Per-request list of upstream items (cities, symbols) that failed and were left out of
+# the response. Responses missing data are served but never cached (see http_cache).
+_degraded_marker: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "demo_stream_degraded_marker", default=None
+)
+
+
+@demo_stream_bp.before_request
+def _reset_request_markers():
+    _stale_marker.set([])
+    _degraded_marker.set([])
+
+
+@demo_stream_bp.after_request
+def _flag_stale_response(response):
+    if served_stale():
+        response.headers['X-Cache'] = 'STALE'
+    return response
+
+
+def served_stale() -> bool:
+    """Whether the current request used a stale upstream copy (see cached_get_json)"""
+    return bool(_stale_marker.get())
+
+
+def mark_degraded(item: str) -> None:
+    """Record that `item` failed upstream and is missing from the current response"""
+    marker = _degraded_marker.get()
+    if marker is not None:
+        marker.append(item)
+
+
+def served_degraded() -> bool:
+    """Whether the current response is missing data because of upstream failures"""
+    return bool(_degraded_marker.get())
+
+# Upstream cache TTLs (seconds)
+USGS_SUMMARY_TTL = 60
+OPEN_METEO_CURRENT_TTL = 300
+OPEN_METEO_HISTORY_TTL = 3600
+OPEN_METEO_FORECAST_TTL = 3600
+
+OPEN_METEO_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Upstream timeouts as (connect, read) seconds. A host that doesn't accept the
+# connection fails within 3s instead of holding the request for the whole read
+# budget; read budgets are sized to each payload, tightest for the 5s ISS poll.
+# _HTTP_ADAPTER makes up to 3 attempts: connect errors and 429/502/503/504 answers are
+# retried (with under a second of backoff in total, never Retry-After), read timeouts
+# are not. A hung upstream therefore costs one read budget; the absolute worst case,
+# every attempt ending in a slow error status, is 3 x (connect + read) plus backoff.
+ISS_TIMEOUT = (3, 4)
+USGS_SUMMARY_TIMEOUT = (3, 20)
+USGS_QUERY_TIMEOUT = (3, 45)
+OPEN_METEO_CURRENT_TIMEOUT = (3, 8)
+OPEN_METEO_HISTORY_TIMEOUT = (3, 25)
+OPEN_METEO_FORECAST_TIMEOUT = (3, 25)
+
+
+def cached_get_json(url: str, params: Optional[Dict[str, Any]] = None, ttl: float = 60,
+                    timeout: Union[float, Tuple[float, float]] = (3, 10),
+                    refresh_ahead: float = 0) -> Any:
+    """
+    GET a JSON document through the shared session, reusing a cached copy for `ttl` seconds.
+    
+    With refresh_ahead, a cached copy that expires within that many seconds is refetched
+    (used by the background refresher to renew entries before requests see them expire).
+    
+    If the upstream request fails and the cached copy expired less than
+    STALE_IF_ERROR_MAX_AGE seconds ago, the stale copy is returned instead of raising
+    and the current request is marked as served stale.
+    
+    The returned object may be shared with other requests - callers must not mutate it.
+    """
+    key = (url, frozenset((params or {}).items()))
+    
+    with _resp_cache_lock:
+        entry = _resp_cache.get(key)
+    if entry and entry["expires_at"] - refresh_ahead > time.monotonic():
+        return entry["data"]
+    
+    headers = {}
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+    
+    try:
+        response = _HTTP.get(url, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        
+        if response.status_code == 304 and entry:
+            new_entry = dict(entry, expires_at=time.monotonic() + ttl)
+        else:
+            new_entry = {
+                "expires_at": time.monotonic() + ttl,
+                "data": _json_body(response),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+    except (requests.RequestException, ValueError) as e:
+        if entry is None or time.monotonic() - entry["expires_at"] > STALE_IF_ERROR_MAX_AGE:
+            raise
+        logger.warning(f"Serving stale copy of {url} after upstream error: {e}")
+        marker = _stale_marker.get()
+        if marker is not None:
+            marker.append(url)
+        return entry["data"]
+    
+    with _resp_cache_lock:
+        if key not in _resp_cache and len(_resp_cache) >= _RESP_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for stale_key in [k for k, e in _resp_cache.items() if e["expires_at"] <= now]:
+                del _resp_cache[stale_key]
+            if len(_resp_cache) >= _RESP_CACHE_MAX_ENTRIES:
+                _resp_cache.clear()
+        _resp_cache[key] = new_entry
+    return new_entry["data"]
+
+
+# Feeds that clients poll on a fixed cadence are refreshed by one background thread,
+# so requests read memory instead of the first client after a TTL miss paying the
+# upstream round-trip. Routes register a job each time they are hit; the thread
+# starts on first demand, drops jobs nobody has asked for within their idle timeout,
+# and exits when none are left, so an idle server makes no upstream calls.
+_REFRESH_IDLE_TIMEOUT = 600
+_REFRESH_MAX_JOBS = 32
+_refresh_lock = threading.Lock()
+_refresh_wakeup = threading.Condition(_refresh_lock)  # Notified when a new job may be due sooner
+_refresh_jobs: Dict[tuple, Dict[str, Any]] = {}  # key -> {interval, job, idle_timeout, next_run, last_demand}
+_refresh_thread: Optional[threading.Thread] = None
+
+# Jobs hand their network I/O to this pool rather than _IO_POOL, so background
+# refreshes never take workers from a request's fan-out
+_REFRESH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="demo-stream-refresh-io")
+
+
+def keep_warm(key: tuple, interval: float, job, idle_timeout: float = _REFRESH_IDLE_TIMEOUT) -> None:
+    """
+    Record demand for a feed so the background refresher runs `job` every `interval` seconds.
+    
+    The caller still serves the request itself (the job's first run is one interval out),
+    so a cold cache behaves exactly as without the refresher. Jobs run on the refresher
+    thread and must be quick or hand their work to _REFRESH_POOL.
+    
+    When all _REFRESH_MAX_JOBS slots are taken, the least recently requested job is
+    dropped to make room; it is registered again the next time its feed is requested.
+    """
+    global _refresh_thread
+    now = time.monotonic()
+    with _refresh_lock:
+        entry = _refresh_jobs.get(key)
+        if entry is not None:
+            entry["last_demand"] = now
+        else:
+            if len(_refresh_jobs) >= _REFRESH_MAX_JOBS:
+                # Query-string variants (weather cities/fields) each get a job; don't let
+                # them lock out newer demand such as the ISS or live-sales feeds
+                oldest = min(_refresh_jobs, key=lambda k: _refresh_jobs[k]["last_demand"])
+                del _refresh_jobs[oldest]
+            _refresh_jobs[key] = {
+                "interval": interval,
+                "job": job,
+                "idle_timeout": idle_timeout,
+                "next_run": now + interval,
+                "last_demand": now,
+            }
+            # The refresher may be sleeping toward a later deadline; let it recompute
+            _refresh_wakeup.notify()
+        
+        if _refresh_thread is None and _refresh_jobs:
+            _refresh_thread = threading.Thread(target=_refresh_loop, name="demo-stream-refresh", daemon=True)
+            _refresh_thread.start()
+
+
+def _refresh_loop() -> None:
+    """Run due refresh jobs until no job has been requested within its idle timeout"""
+    global _refresh_thread
+    while True:
+        now = time.monotonic()
+        with _refresh_lock:
+            for key in [k for k, e in _refresh_jobs.items() if now - e["last_demand"] > e["idle_timeout"]]:
+                del _refresh_jobs[key]
+            if not _refresh_jobs:
+                _refresh_thread = None
+                return
+            
+            due = [e for e in _refresh_jobs.values() if e["next_run"] <= now]
+            for entry in due:
+                entry["next_run"] = now + entry["interval"]
+        
+        for entry in due:
+            try:
+                entry["job"]()
+            except Exception as e:
+                logger.warning(f"Background refresh failed: {e}")
+        
+        # Sleep until the earliest deadline, computed under the lock so a job added by
+        # keep_warm in the meantime is either seen here or wakes the wait
+        with _refresh_lock:
+            wake_at = min(e["next_run"] for e in _refresh_jobs.values())
+            _refresh_wakeup.wait(max(0.0, wake_at - time.monotonic()))
+
+
+def warm_cached_get_json(url: str, params_list: List[Dict[str, Any]], ttl: float,
+                         timeout: Union[float, Tuple[float, float]] = (3, 10)) -> None:
+    """
+    Refresher job body: renew cached_get_json entries before they expire.
+    
+    Run every ttl/4 seconds; entries are refetched once under ttl/2 remains, so
+    each is fetched about every 3/4 ttl and never seen expired by a request.
+    """
+    def refresh(params):
+        try:
+            cached_get_json(url, params, ttl=ttl, timeout=timeout, refresh_ahead=ttl / 2)
+        except Exception as e:
+            logger.warning(f"Background refresh of {url} failed: {e}")
+    
+    # Hand the fetches to the refresh pool so a slow upstream never stalls other jobs
+    for params in params_list:
+        _REFRESH_POOL.submit(refresh, params)
+
+
+def keep_open_meteo_warm(key: tuple, params_list: List[Dict[str, Any]], ttl: float,
+                         timeout: Union[float, Tuple[float, float]] = OPEN_METEO_CURRENT_TIMEOUT) -> None:
+    """Keep the Open-Meteo responses for params_list refreshed in the background while in demand"""
+    keep_warm(key, ttl / 4,
+              lambda: warm_cached_get_json(OPEN_METEO_FORECAST_URL, params_list, ttl, timeout),
+              idle_timeout=max(_REFRESH_IDLE_TIMEOUT, 2 * ttl))
+
+
 # ============================================================================
 # ISS Location Tracking - Real-time trajectory
 # Returns accumulated position history that grows over time
 # Recommended refresh: 5-10 seconds
 # ============================================================================
 
-# Thread-safe storage for ISS position history
-_iss_track_lock = threading.Lock()
-_iss_track_history: deque = deque(maxlen=10000)  # Keep last 10000 positions (~20000 min at 5s intervals)
-_iss_last_fetch: Optional[datetime] = None
+# Thread-safe storage for ISS position history: a fixed-size ring buffer of
+# epoch-second timestamps and coordinates (one contiguous allocation, no
+# per-position dicts; timestamps need no parsing when filtering by time).
+_ISS_HISTORY_SIZE = 10000  # Keep last 10000 positions (~20000 min at 5s intervals)
+_ISS_RECORD_DTYPE = np.dtype([("t", "f8"), ("lat", "f8"), ("lon", "f8"), ("fetched", "f8")])
+_iss_track_lock = threading.Lock()  # Guards buffer state; never held across network I/O
+_iss_fetch_lock = threading.Lock()  # Held by the one request currently fetching a new position
+_iss_track_buf = np.zeros(_ISS_HISTORY_SIZE, dtype=_ISS_RECORD_DTYPE)
+_iss_track_head = 0  # Next slot to write
+_iss_track_len = 0   # Number of valid slots
+_iss_track_writes = 0  # Positions appended so far; identifies the buffer state a render was made from
+_iss_last_fetch_mono: Optional[float] = None  # time.monotonic() of the last successful fetch
+_ISS_FETCH_INTERVAL = 3  # Seconds between polls of the position API (background refresher cadence)
+_ISS_STALE_AFTER = 10    # Requests poll inline only when the buffer is this old (cold start, refresher behind)
+
+# Rendered CSV bodies for the current buffer state, keyed by (minutes, limit) and
+# guarded by _iss_track_lock. An entry is (oldest timestamp in the body, body): it
+# stays valid until the next append, or until that oldest row ages out of the window.
+_ISS_RENDER_CACHE_MAX_ENTRIES = 64
+_iss_render_writes = -1
+_iss_render_cache: Dict[Tuple[int, int], Tuple[float, bytes]] = {}
 
 def _fetch_iss_position() -> Optional[Dict[str, Any]]:
-    """Fetch current ISS position from API"""
+    """Fetch current ISS position from API (timestamp as epoch seconds)"""
     try:
-        response = requests.get("http://api.open-notify.org/iss-now.json", timeout=10)
+        response = _HTTP.get("http://api.open-notify.org/iss-now.json", timeout=ISS_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = _json_body(response)
         position = data.get("iss_position", {})
         return {
-            "timestamp": datetime.utcfromtimestamp(data.get("timestamp", 0)).isoformat() + "Z",
+            "t": float(data.get("timestamp", 0)),
             "latitude": float(position.get("latitude", 0)),
             "longitude": float(position.get("longitude", 0)),
         }
@@ -126,8 +573,82 @@ def _fetch_iss_position() -> Optional[Dict[str, Any]]:
         return None
 
 
+def _iss_append(position: Dict[str, Any], fetched_epoch: float) -> None:
+    """Write a position into the ring buffer (caller holds _iss_track_lock)"""
+    global _iss_track_head, _iss_track_len, _iss_track_writes
+    _iss_track_buf[_iss_track_head] = (position["t"], position["latitude"], position["longitude"], fetched_epoch)
+    _iss_track_head = (_iss_track_head + 1) % _ISS_HISTORY_SIZE
+    _iss_track_len = min(_iss_track_len + 1, _ISS_HISTORY_SIZE)
+    _iss_track_writes += 1
+
+
+def _iss_should_fetch(now_mono: float, min_age: float) -> bool:
+    """Whether the last successful fetch is at least min_age seconds old"""
+    last_fetch = _iss_last_fetch_mono
+    return last_fetch is None or now_mono - last_fetch >= min_age
+
+
+def _iss_poll(min_age: float) -> None:
+    """
+    Fetch and buffer a new position if the last one is at least min_age seconds old.
+    
+    Only one caller fetches at a time; others don't wait for it and keep
+    serving what is already buffered.
+    """
+    global _iss_last_fetch_mono
+    now_mono = time.monotonic()
+    if _iss_should_fetch(now_mono, min_age) and _iss_fetch_lock.acquire(blocking=False):
+        try:
+            if _iss_should_fetch(now_mono, min_age):
+                fetched_epoch = time.time()
+                position = _fetch_iss_position()
+                if position:
+                    with _iss_track_lock:
+                        _iss_append(position, fetched_epoch)
+                        _iss_last_fetch_mono = now_mono
+        finally:
+            _iss_fetch_lock.release()
+
+
+def _iss_poll_in_background() -> None:
+    """Refresher job: poll on the refresh pool so a slow position API never stalls other jobs"""
+    # _iss_fetch_lock already keeps a lagging poll from overlapping the next one. The
+    # refresher already spaces these polls an interval apart, so min_age only needs to
+    # skip one that lands right after an inline poll; requiring the full interval would
+    # drop a whole cycle whenever the wakeup (or the pool) runs a little early.
+    _REFRESH_POOL.submit(_iss_poll, _ISS_FETCH_INTERVAL / 2)
+
+
+def _iss_snapshot() -> np.ndarray:
+    """Copy the buffered positions out in insertion order (caller holds _iss_track_lock)"""
+    if _iss_track_len < _ISS_HISTORY_SIZE:
+        return _iss_track_buf[:_iss_track_len].copy()
+    return np.concatenate((_iss_track_buf[_iss_track_head:], _iss_track_buf[:_iss_track_head]))
+
+
+def _epoch_isoformat(epochs: np.ndarray) -> np.ndarray:
+    """Format epoch seconds like datetime.utcfromtimestamp(t).isoformat() + "Z", vectorized"""
+    micros = np.round(epochs * 1e6).astype("int64")
+    stamps = pd.to_datetime(micros, unit="us")
+    # isoformat() leaves out the fraction when it is zero
+    return np.where(micros % 1_000_000 == 0,
+                    stamps.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    stamps.strftime("%Y-%m-%dT%H:%M:%S.%fZ"))
+
+
+def _iss_frame(records: np.ndarray) -> pd.DataFrame:
+    """Render buffered (t, lat, lon, fetched) records as the CSV columns, without per-row objects"""
+    return pd.DataFrame({
+        "timestamp": _epoch_isoformat(records["t"]),
+        "latitude": records["lat"],
+        "longitude": records["lon"],
+        "fetched_at": _epoch_isoformat(records["fetched"]),
+    })
+
+
 @demo_stream_bp.route('/iss', methods=['GET'])
 @limiter.limit(ISS_RATE_LIMIT)
+@http_cache(ISS_CACHE_TTL)
 def get_iss():
     """
     ISS position trajectory over time. Each refresh adds new position(s).
@@ -141,46 +662,61 @@ def get_iss():
     
     Recommended refresh: 5-10 seconds
     """
-    global _iss_last_fetch
+    global _iss_render_writes
     
     minutes = min(1440, max(1, int(request.args.get('minutes', 1440))))
     limit = min(10000, max(1000, int(request.args.get('limit', 10000))))
     
-    now = datetime.utcnow()
-    cutoff = now - timedelta(minutes=minutes)
+    now_epoch = time.time()
+    cutoff_epoch = now_epoch - minutes * 60
+    
+    # The background refresher polls the position API while the feed is in demand;
+    # fetch inline only if the buffer is empty or the refresher has fallen behind
+    keep_warm(("iss",), _ISS_FETCH_INTERVAL, _iss_poll_in_background)
+    _iss_poll(_ISS_STALE_AFTER)
     
-    # Fetch new position if enough time has passed (at least 3 seconds)
+    render_key = (minutes, limit)
     with _iss_track_lock:
-        should_fetch = _iss_last_fetch is None or (now - _iss_last_fetch).total_seconds() >= 3
-        
-        if should_fetch:
-            position = _fetch_iss_position()
-            if position:
-                position["fetched_at"] = now.isoformat() + "Z"
-                _iss_track_history.append(position)
-                _iss_last_fetch = now
-        
-        # Filter to requested time window and limit
-        rows = []
-        for pos in _iss_track_history:
-            try:
-                pos_time = datetime.fromisoformat(pos["timestamp"].replace("Z", "+00:00")).replace(tzinfo=None)
-                if pos_time >= cutoff:
-                    rows.append(pos)
-            except:
-                continue
-        
-        # Limit and sort by time
-        rows = sorted(rows, key=lambda x: x["timestamp"])[-limit:]
+        writes = _iss_track_writes
+        cached = _iss_render_cache.get(render_key) if _iss_render_writes == writes else None
+        if cached is not None and cutoff_epoch <= cached[0]:
+            body = cached[1]
+        else:
+            body = None
+            snapshot = _iss_snapshot()
+    
+    # Nothing appended and nothing aged out since the last identical request
+    if body is not None:
+        return Response(body, mimetype='text/csv', headers={'Access-Control-Allow-Origin': '*'})
+    
+    # Filter to requested time window and limit, outside the lock
+    times = snapshot["t"]
+    if np.any(times[1:] < times[:-1]):
+        snapshot = snapshot[np.argsort(times, kind="stable")]
+        times = snapshot["t"]
+    start = np.searchsorted(times, cutoff_epoch, side="left")
+    records = snapshot[start:][-limit:]
     
     # If we have no data yet, fetch once and return
-    if not rows:
+    if len(records) == 0:
         position = _fetch_iss_position()
         if position:
-            position["fetched_at"] = now.isoformat() + "Z"
-            rows = [position]
+            records = np.array([(position["t"], position["latitude"], position["longitude"], now_epoch)],
+                               dtype=_ISS_RECORD_DTYPE)
+        return make_csv_response_df(_iss_frame(records))
     
-    return make_csv_response(rows)
+    response = make_csv_response_df(_iss_frame(records))
+    
+    with _iss_track_lock:
+        # Skip caching if a position was appended while rendering; the body is already behind
+        if _iss_track_writes == writes:
+            if _iss_render_writes != writes:
+                _iss_render_cache.clear()
+                _iss_render_writes = writes
+            if len(_iss_render_cache) < _ISS_RENDER_CACHE_MAX_ENTRIES:
+                _iss_render_cache[render_key] = (float(records["t"][0]), response.get_data())
+    
+    return response
 
 # ============================================================================
 # USGS Earthquakes - Accumulating dataset of seismic events
@@ -188,8 +724,21 @@ def get_iss():
 # Recommended refresh: 60 seconds
 # ============================================================================
 
+_EARTHQUAKE_COLUMNS = [
+    "id", "time", "latitude", "longitude", "depth_km", "magnitude", "place", "type", "status",
+    "felt",     # Number of people who reported feeling it
+    "cdi",      # Maximum reported intensity
+    "mmi",      # Maximum estimated instrumental intensity
+    "tsunami",  # Tsunami warning (0 or 1)
+    "sig",      # Significance (0-1000)
+    "net",      # Network that reported the event
+    "code",     # Event code
+    "url",      # USGS detail page URL
+]
+
 @demo_stream_bp.route('/earthquakes', methods=['GET'])
 @limiter.limit(EARTHQUAKE_RATE_LIMIT)
+@http_cache(EARTHQUAKE_CACHE_TTL)
 def get_earthquakes():
     """
     Earthquakes from USGS. Dataset grows as new quakes occur.
@@ -217,22 +766,28 @@ def get_earthquakes():
     limit = min(20000, max(1, int(request.args.get('limit', 20000))))
     use_query_api = request.args.get('use_query_api', 'false').lower() == 'true'
     
-    fetched_at = datetime.utcnow().isoformat() + "Z"
-    rows = []
+    max_mag = float(max_magnitude) if max_magnitude else None
     
-    # Parse 'since' filter if provided
+    now = datetime.utcnow()
+    fetched_at = now.isoformat() + "Z"
+    records = []
+    
+    # Parse 'since' filter if provided, as epoch milliseconds (what USGS uses) so the
+    # per-feature check is a plain number compare. Naive times are taken as UTC.
     since_timestamp = None
     if since_str:
         try:
-            since_dt = datetime.fromisoformat(since_str.replace("Z", "+00:00")).replace(tzinfo=None)
-            since_timestamp = since_dt.timestamp() * 1000  # USGS uses milliseconds
-        except:
-            pass
-    
+            since_dt = datetime.fromisoformat(since_str.replace("Z", "+00:00"))
+            if since_dt.tzinfo is None:
+                since_dt = since_dt.replace(tzinfo=timezone.utc)
+            since_timestamp = since_dt.timestamp() * 1000
+        except ValueError:
+            logger.warning(f"Ignoring unparseable 'since' value: {since_str!r}")
+    
+    response = None
     try:
         if use_query_api or limit > 1000:
             # Use USGS Query API for larger datasets
-            now = datetime.utcnow()
             timeframe_deltas = {
                 "hour": timedelta(hours=1),
                 "day": timedelta(days=1),
@@ -251,22 +806,24 @@ def get_earthquakes():
             }
             
             if max_magnitude:
-                params["maxmagnitude"] = float(max_magnitude)
+                params["maxmagnitude"] = max_mag
             
             url = "https://earthquake.usgs.gov/fdsnws/event/1/query"
-            response = requests.get(url, params=params, timeout=60)
+            # Stream-parse the (potentially multi-MB) GeoJSON so features that
+            # fail the filters below never materialize as Python objects
+            response = _HTTP.get(url, params=params, stream=True, timeout=USGS_QUERY_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            response.raw.decode_content = True
+            features = ijson.items(response.raw, "features.item", use_float=True)
         else:
             # Use summary feeds for quick queries
             feeds = {"hour": "all_hour", "day": "all_day", "week": "all_week", "month": "all_month"}
             feed = feeds.get(timeframe, "all_day")
             url = f"https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/{feed}.geojson"
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = cached_get_json(url, ttl=USGS_SUMMARY_TTL, timeout=USGS_SUMMARY_TIMEOUT)
+            features = data.get("features", [])
         
-        for feature in data.get("features", []):
+        for feature in features:
             props = feature.get("properties", {})
             coords = feature.get("geometry", {}).get("coordinates", [0, 0, 0])
             
@@ -275,50 +832,64 @@ def get_earthquakes():
             if mag is not None:
                 if mag < min_magnitude:
                     continue
-                if max_magnitude and mag > float(max_magnitude):
+                if max_mag is not None and mag > max_mag:
                     continue
             
             # Filter by 'since' time
             quake_time = props.get("time", 0)
-            if since_timestamp and quake_time <= since_timestamp:
+            if since_timestamp is not None and quake_time <= since_timestamp:
                 continue
             
-            rows.append({
-                "id": feature.get("id"),
-                "time": datetime.utcfromtimestamp(quake_time / 1000).isoformat() + "Z",
-                "latitude": coords[1] if len(coords) > 1 else None,
-                "longitude": coords[0] if len(coords) > 0 else None,
-                "depth_km": coords[2] if len(coords) > 2 else None,
-                "magnitude": mag,
-                "place": props.get("place"),
-                "type": props.get("type", "earthquake"),
-                "status": props.get("status"),
-                "felt": props.get("felt"),  # Number of people who reported feeling it
-                "cdi": props.get("cdi"),  # Maximum reported intensity
-                "mmi": props.get("mmi"),  # Maximum estimated instrumental intensity
-                "tsunami": props.get("tsunami", 0),  # Tsunami warning (0 or 1)
-                "sig": props.get("sig"),  # Significance (0-1000)
-                "net": props.get("net"),  # Network that reported the event
-                "code": props.get("code"),  # Event code
-                "url": props.get("url"),  # USGS detail page URL
-                "fetched_at": fetched_at
-            })
+            records.append((
+                feature.get("id"),
+                quake_time,
+                coords[1] if len(coords) > 1 else None,
+                coords[0] if len(coords) > 0 else None,
+                coords[2] if len(coords) > 2 else None,
+                mag,
+                props.get("place"),
+                props.get("type", "earthquake"),
+                props.get("status"),
+                props.get("felt"),
+                props.get("cdi"),
+                props.get("mmi"),
+                props.get("tsunami", 0),
+                props.get("sig"),
+                props.get("net"),
+                props.get("code"),
+                props.get("url"),
+            ))
             
             # Limit results if using summary feed
-            if not use_query_api and len(rows) >= limit:
+            if not use_query_api and len(records) >= limit:
                 break
         
-        # Sort by time, most recent first
-        rows.sort(key=lambda x: x["time"], reverse=True)
+        if not records:
+            return make_csv_response([])
         
-        # Apply limit (in case summary feed returned more than requested)
-        if len(rows) > limit:
-            rows = rows[:limit]
+        # Build the table column-wise; object dtype keeps ints/None as-is in the CSV
+        df = pd.DataFrame(records, columns=_EARTHQUAKE_COLUMNS, dtype=object)
         
-        return make_csv_response(rows)
+        # Sort by time, most recent first, and apply limit (in case summary feed returned more than requested)
+        time_ms = df["time"].astype("int64")
+        order = np.argsort(-time_ms.to_numpy(), kind="stable")[:limit]
+        df = df.iloc[order].reset_index(drop=True)
+        time_ms = time_ms.iloc[order].reset_index(drop=True)
+        
+        # Format times like datetime.isoformat(): microseconds only when non-zero
+        quake_times = pd.to_datetime(time_ms, unit="ms")
+        df["time"] = np.where(time_ms % 1000 == 0,
+                              quake_times.dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                              quake_times.dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ"))
+        df["fetched_at"] = fetched_at
+        
+        return make_csv_response_df(df)
     except Exception as e:
         logger.warning(f"Failed to fetch earthquakes: {e}")
         return Response(f"error,{str(e)}", mimetype='text/csv'), 500
+    finally:
+        if response is not None:
+            response.close()
 
 
 # ============================================================================
@@ -326,6 +897,27 @@ def get_earthquakes():
 # Recommended refresh: 300 seconds
 # ============================================================================
 
+# Weather code descriptions (WMO Weather interpretation codes)
+_WEATHER_CODE_DESCRIPTIONS = {
+    0: "Clear", 1: "Mainly Clear", 2: "Partly Cloudy", 3: "Overcast",
+    45: "Foggy", 48: "Depositing Rime Fog",
+    51: "Light Drizzle", 53: "Moderate Drizzle", 55: "Dense Drizzle",
+    61: "Slight Rain", 63: "Moderate Rain", 65: "Heavy Rain",
+    71: "Slight Snow", 73: "Moderate Snow", 75: "Heavy Snow",
+    80: "Slight Showers", 81: "Moderate Showers", 82: "Violent Showers",
+    85: "Slight Snow Showers", 86: "Heavy Snow Showers",
+    95: "Thunderstorm", 96: "Thunderstorm with Hail", 99: "Thunderstorm with Heavy Hail"
+}
+
+# WMO codes are 0-99, so a flat tuple indexed by code replaces a dict lookup per row
+WEATHER_DESC = tuple(_WEATHER_CODE_DESCRIPTIONS.get(code, "Unknown") for code in range(100))
+
+
+def _weather_description(code) -> str:
+    """Describe a WMO weather code ("Unknown" for missing/unrecognized codes)"""
+    return WEATHER_DESC[code] if isinstance(code, int) and 0 <= code < 100 else "Unknown"
+
+
 WEATHER_CITIES = [
     {"name": "Seattle", "lat": 47.6062, "lon": -122.3321, "state": "WA"},
     {"name": "New York", "lat": 40.7128, "lon": -74.0060, "state": "NY"},
@@ -349,8 +941,43 @@ WEATHER_CITIES = [
     {"name": "New Orleans", "lat": 29.9511, "lon": -90.0715, "state": "LA"},
 ]
 
+def _current_weather_params(city: Dict[str, Any], current: str) -> Dict[str, Any]:
+    """Open-Meteo query for a city's current conditions (current: comma-separated fields)"""
+    return {
+        "latitude": city["lat"],
+        "longitude": city["lon"],
+        "current": current,
+        "timezone": "auto"
+    }
+
+
+def _fetch_city_weather(city: Dict[str, Any], current_fields: List[str],
+                        columns: List[Tuple[str, str]], fetched_at: str) -> Optional[Dict[str, Any]]:
+    """Fetch current weather for a single city (runs on _IO_POOL)"""
+    try:
+        params = _current_weather_params(city, ",".join(current_fields))
+        data = cached_get_json(OPEN_METEO_FORECAST_URL, params, ttl=OPEN_METEO_CURRENT_TTL, timeout=OPEN_METEO_CURRENT_TIMEOUT)
+        current = data.get("current", {})
+        
+        row = {
+            "city": city["name"],
+            "state": city.get("state", ""),
+            "latitude": city["lat"],
+            "longitude": city["lon"],
+            "fetched_at": fetched_at
+        }
+        for column, field in columns:
+            row[column] = current.get(field)
+        return row
+    except Exception as e:
+        logger.warning(f"Failed to fetch weather for {city['name']}: {e}")
+        mark_degraded(city['name'])
+        return None
+
+
 @demo_stream_bp.route('/weather', methods=['GET'])
 @limiter.limit(WEATHER_RATE_LIMIT)
+@http_cache(WEATHER_CACHE_TTL)
 def get_weather():
     """
     Current weather for major US cities. Updates every 15 minutes.
@@ -364,7 +991,6 @@ def get_weather():
     Recommended refresh: 300 seconds
     """
     fetched_at = datetime.utcnow().isoformat() + "Z"
-    rows = []
     
     # Parse city filter
     cities_param = request.args.get('cities', '').strip()
@@ -387,62 +1013,48 @@ def get_weather():
     include_pressure = include_all or 'pressure' in fields_param
     include_cloud = include_all or 'cloud_cover' in fields_param
     
-    for city in cities_to_fetch:
-        try:
-            # Build current weather parameters
-            current_fields = []
-            if include_temp:
-                current_fields.append("temperature_2m")
-            if include_humidity:
-                current_fields.append("relative_humidity_2m")
-            if include_wind:
-                current_fields.extend(["wind_speed_10m", "wind_direction_10m"])
-            if include_precip:
-                current_fields.append("precipitation")
-            if include_pressure:
-                current_fields.append("surface_pressure")
-            if include_cloud:
-                current_fields.append("cloud_cover")
-            
-            if not current_fields:
-                current_fields = ["temperature_2m", "relative_humidity_2m", "wind_speed_10m", "precipitation"]
-            
-            params = {
-                "latitude": city["lat"],
-                "longitude": city["lon"],
-                "current": ",".join(current_fields),
-                "timezone": "auto"
-            }
-            response = requests.get("https://api.open-meteo.com/v1/forecast", params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            current = data.get("current", {})
-            
-            row = {
-                "city": city["name"],
-                "state": city.get("state", ""),
-                "latitude": city["lat"],
-                "longitude": city["lon"],
-                "fetched_at": fetched_at
-            }
-            
-            if include_temp:
-                row["temperature_c"] = current.get("temperature_2m")
-            if include_humidity:
-                row["humidity_percent"] = current.get("relative_humidity_2m")
-            if include_wind:
-                row["wind_speed_kmh"] = current.get("wind_speed_10m")
-                row["wind_direction_deg"] = current.get("wind_direction_10m")
-            if include_precip:
-                row["precipitation_mm"] = current.get("precipitation")
-            if include_pressure:
-                row["pressure_hpa"] = current.get("surface_pressure")
-            if include_cloud:
-                row["cloud_cover_percent"] = current.get("cloud_cover")
-            
-            rows.append(row)
-        except Exception as e:
-            logger.warning(f"Failed to fetch weather for {city['name']}: {e}")
+    # Build current weather parameters (the same for every city)
+    current_fields = []
+    if include_temp:
+        current_fields.append("temperature_2m")
+    if include_humidity:
+        current_fields.append("relative_humidity_2m")
+    if include_wind:
+        current_fields.extend(["wind_speed_10m", "wind_direction_10m"])
+    if include_precip:
+        current_fields.append("precipitation")
+    if include_pressure:
+        current_fields.append("surface_pressure")
+    if include_cloud:
+        current_fields.append("cloud_cover")
+    
+    if not current_fields:
+        current_fields = ["temperature_2m", "relative_humidity_2m", "wind_speed_10m", "precipitation"]
+    
+    # Output columns as (row key, API field)
+    columns = []
+    if include_temp:
+        columns.append(("temperature_c", "temperature_2m"))
+    if include_humidity:
+        columns.append(("humidity_percent", "relative_humidity_2m"))
+    if include_wind:
+        columns.extend([("wind_speed_kmh", "wind_speed_10m"), ("wind_direction_deg", "wind_direction_10m")])
+    if include_precip:
+        columns.append(("precipitation_mm", "precipitation"))
+    if include_pressure:
+        columns.append(("pressure_hpa", "surface_pressure"))
+    if include_cloud:
+        columns.append(("cloud_cover_percent", "cloud_cover"))
+    
+    current = ",".join(current_fields)
+    keep_open_meteo_warm(
+        ("weather", current, tuple(c["name"] for c in cities_to_fetch)),
+        [_current_weather_params(city, current) for city in cities_to_fetch],
+        OPEN_METEO_CURRENT_TTL
+    )
+    
+    results = _io_map(lambda city: _fetch_city_weather(city, current_fields, columns, fetched_at), cities_to_fetch)
+    rows = [row for row in results if row is not None]
     
     return make_csv_response(rows)
 
@@ -452,8 +1064,66 @@ def get_weather():
 # Dataset grows as new hours pass
 # ============================================================================
 
+def _pad_to(values: list, n: int, fill=None) -> list:
+    """Truncate or pad a parallel API array to exactly n entries"""
+    if len(values) == n:
+        return values
+    return values[:n] + [fill] * (n - len(values))
+
+
+def _rounded_column(values: list, digits: int) -> pd.Series:
+    """Round readings with Python's round(), as an object column so ints stay ints in the CSV"""
+    # Not Series.round(): NumPy rounds binary floats half-to-even, which differs from
+    # round() at ties, and a float64 column would print integral readings as "15.0"
+    return pd.Series([round(v, digits) if v is not None else None for v in values], dtype=object)
+
+
+def _fetch_city_weather_history(city: Dict[str, Any], api_url: str, start_date: str, end_date: str,
+                                fetched_at: str) -> Optional[pd.DataFrame]:
+    """Fetch hourly weather history for a single city as a DataFrame (runs on _IO_POOL)"""
+    try:
+        params = {
+            "latitude": city["lat"],
+            "longitude": city["lon"],
+            "hourly": "temperature_2m,relative_humidity_2m,wind_speed_10m,precipitation,weather_code,pressure_msl",
+            "timezone": "auto",
+            "start_date": start_date,
+            "end_date": end_date
+        }
+        
+        data = cached_get_json(api_url, params, ttl=OPEN_METEO_HISTORY_TTL, timeout=OPEN_METEO_HISTORY_TIMEOUT)
+        
+        hourly = data.get("hourly", {})
+        times = pd.Series(hourly.get("time", []), dtype=object)
+        n = len(times)
+        if n == 0:
+            return None
+        weather_codes = _pad_to(hourly.get("weather_code", []), n, fill=0)
+        
+        # Open-Meteo returns the hourly arrays in parallel, so each becomes a column directly
+        return pd.DataFrame({
+            "city": city["name"],
+            "state": city.get("state", ""),
+            # Parse timestamp - handle both formats
+            "timestamp": times.where(times.str.contains("T", regex=False, na=True), times + "T00:00:00Z"),
+            "temperature_c": _rounded_column(_pad_to(hourly.get("temperature_2m", []), n), 1),
+            "humidity_percent": pd.Series(_pad_to(hourly.get("relative_humidity_2m", []), n), dtype=object),
+            "wind_speed_kmh": _rounded_column(_pad_to(hourly.get("wind_speed_10m", []), n), 1),
+            "precipitation_mm": _rounded_column(_pad_to(hourly.get("precipitation", []), n), 2),
+            "pressure_hpa": _rounded_column(_pad_to(hourly.get("pressure_msl", []), n), 1),
+            "weather_code": pd.Series(weather_codes, dtype=object),
+            "weather": [_weather_description(code) for code in weather_codes],
+            "fetched_at": fetched_at
+        })
+    except Exception as e:
+        logger.warning(f"Failed to fetch weather history for {city['name']}: {e}")
+        mark_degraded(city['name'])
+        return None
+
+
 @demo_stream_bp.route('/weather/history', methods=['GET'])
 @limiter.limit(WEATHER_RATE_LIMIT)
+@http_cache(WEATHER_HISTORY_CACHE_TTL)
 def get_weather_history():
     """
     Hourly weather history for one or more locations. Dataset grows with each hour.
@@ -495,10 +1165,8 @@ def get_weather_history():
         # Default to Seattle if no cities specified
         cities_to_fetch = [WEATHER_CITIES[0]]
     
-    fetched_at = datetime.utcnow().isoformat() + "Z"
-    rows = []
-    
     end_date = datetime.utcnow()
+    fetched_at = end_date.isoformat() + "Z"
     start_date = end_date - timedelta(days=days)
     
     # Determine which API to use
@@ -513,76 +1181,24 @@ def get_weather_history():
         # Use archive for data older than 6 days
         use_archive = days > 6
     
-    # Weather code descriptions (WMO Weather interpretation codes)
-    weather_desc = {
-        0: "Clear", 1: "Mainly Clear", 2: "Partly Cloudy", 3: "Overcast",
-        45: "Foggy", 48: "Depositing Rime Fog",
-        51: "Light Drizzle", 53: "Moderate Drizzle", 55: "Dense Drizzle",
-        61: "Slight Rain", 63: "Moderate Rain", 65: "Heavy Rain",
-        71: "Slight Snow", 73: "Moderate Snow", 75: "Heavy Snow",
-        80: "Slight Showers", 81: "Moderate Showers", 82: "Violent Showers",
-        85: "Slight Snow Showers", 86: "Heavy Snow Showers",
-        95: "Thunderstorm", 96: "Thunderstorm with Hail", 99: "Thunderstorm with Heavy Hail"
-    }
+    # Use archive API for historical data, forecast API for recent data
+    if use_archive:
+        api_url = "https://api.open-meteo.com/v1/archive"
+    else:
+        api_url = "https://api.open-meteo.com/v1/forecast"
     
-    for city in cities_to_fetch:
-        try:
-            params = {
-                "latitude": city["lat"],
-                "longitude": city["lon"],
-                "hourly": "temperature_2m,relative_humidity_2m,wind_speed_10m,precipitation,weather_code,pressure_msl",
-                "timezone": "auto",
-                "start_date": start_date.strftime("%Y-%m-%d"),
-                "end_date": end_date.strftime("%Y-%m-%d")
-            }
-            
-            # Use archive API for historical data, forecast API for recent data
-            if use_archive:
-                api_url = "https://api.open-meteo.com/v1/archive"
-            else:
-                api_url = "https://api.open-meteo.com/v1/forecast"
-            
-            response = requests.get(api_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            hourly = data.get("hourly", {})
-            times = hourly.get("time", [])
-            temps = hourly.get("temperature_2m", [])
-            humidity = hourly.get("relative_humidity_2m", [])
-            wind = hourly.get("wind_speed_10m", [])
-            precip = hourly.get("precipitation", [])
-            weather_codes = hourly.get("weather_code", [])
-            pressure = hourly.get("pressure_msl", [])
-            
-            for i, time_str in enumerate(times):
-                code = weather_codes[i] if i < len(weather_codes) else 0
-                # Parse timestamp - handle both formats
-                if "T" in time_str:
-                    timestamp_str = time_str
-                else:
-                    timestamp_str = time_str + "T00:00:00Z"
-                
-                rows.append({
-                    "city": city["name"],
-                    "state": city.get("state", ""),
-                    "timestamp": timestamp_str,
-                    "temperature_c": round(temps[i], 1) if i < len(temps) and temps[i] is not None else None,
-                    "humidity_percent": humidity[i] if i < len(humidity) and humidity[i] is not None else None,
-                    "wind_speed_kmh": round(wind[i], 1) if i < len(wind) and wind[i] is not None else None,
-                    "precipitation_mm": round(precip[i], 2) if i < len(precip) and precip[i] is not None else None,
-                    "pressure_hpa": round(pressure[i], 1) if i < len(pressure) and pressure[i] is not None else None,
-                    "weather_code": code,
-                    "weather": weather_desc.get(code, "Unknown"),
-                    "fetched_at": fetched_at
-                })
-        except Exception as e:
-            logger.warning(f"Failed to fetch weather history for {city['name']}: {e}")
+    start_str = start_date.strftime("%Y-%m-%d")
+    end_str = end_date.strftime("%Y-%m-%d")
+    frames = [frame for frame in _io_map(
+        lambda city: _fetch_city_weather_history(city, api_url, start_str, end_str, fetched_at),
+        cities_to_fetch) if frame is not None]
+    if not frames:
+        return make_csv_response([])
     
     # Sort by city, then timestamp
-    rows.sort(key=lambda x: (x["city"], x["timestamp"]))
+    df = pd.concat(frames, ignore_index=True).sort_values(["city", "timestamp"], kind="stable")
     
-    return make_csv_response(rows)
+    return make_csv_response_df(df)
 
 
 # ============================================================================
@@ -590,8 +1206,79 @@ def get_weather_history():
 # Recommended refresh: 3600 seconds (1 hour)
 # ============================================================================
 
+def _forecast_params(city: Dict[str, Any], days: int, hourly_mode: bool) -> Dict[str, Any]:
+    """Open-Meteo query for a city's daily or hourly forecast"""
+    params = {
+        "latitude": city["lat"],
+        "longitude": city["lon"],
+        "forecast_days": days,
+        "timezone": "auto"
+    }
+    if hourly_mode:
+        params["hourly"] = "temperature_2m,relative_humidity_2m,wind_speed_10m,precipitation,weather_code,pressure_msl"
+    else:
+        params["daily"] = "temperature_2m_max,temperature_2m_min,precipitation_sum,wind_speed_10m_max,weather_code"
+    return params
+
+
+def _fetch_city_forecast(city: Dict[str, Any], days: int, hourly_mode: bool, fetched_at: str) -> Optional[pd.DataFrame]:
+    """Fetch daily or hourly forecast for a single city as a DataFrame (runs on _IO_POOL)"""
+    try:
+        params = _forecast_params(city, days, hourly_mode)
+        data = cached_get_json(OPEN_METEO_FORECAST_URL, params, ttl=OPEN_METEO_FORECAST_TTL, timeout=OPEN_METEO_FORECAST_TIMEOUT)
+        
+        if hourly_mode:
+            # Hourly forecast
+            hourly = data.get("hourly", {})
+            times = hourly.get("time", [])
+            n = len(times)
+            if n == 0:
+                return None
+            weather_codes = _pad_to(hourly.get("weather_code", []), n, fill=0)
+            
+            return pd.DataFrame({
+                "city": city["name"],
+                "state": city.get("state", ""),
+                "timestamp": pd.Series(times, dtype=object),
+                "temperature_c": _rounded_column(_pad_to(hourly.get("temperature_2m", []), n), 1),
+                "humidity_percent": pd.Series(_pad_to(hourly.get("relative_humidity_2m", []), n), dtype=object),
+                "wind_speed_kmh": _rounded_column(_pad_to(hourly.get("wind_speed_10m", []), n), 1),
+                "precipitation_mm": _rounded_column(_pad_to(hourly.get("precipitation", []), n), 2),
+                "pressure_hpa": _rounded_column(_pad_to(hourly.get("pressure_msl", []), n), 1),
+                "weather_code": pd.Series(weather_codes, dtype=object),
+                "weather": [_weather_description(code) for code in weather_codes],
+                "fetched_at": fetched_at
+            })
+        else:
+            # Daily forecast
+            daily = data.get("daily", {})
+            times = daily.get("time", [])
+            n = len(times)
+            if n == 0:
+                return None
+            weather_codes = _pad_to(daily.get("weather_code", []), n, fill=0)
+            
+            return pd.DataFrame({
+                "city": city["name"],
+                "state": city.get("state", ""),
+                "date": pd.Series(times, dtype=object),
+                "temperature_max_c": _rounded_column(_pad_to(daily.get("temperature_2m_max", []), n), 1),
+                "temperature_min_c": _rounded_column(_pad_to(daily.get("temperature_2m_min", []), n), 1),
+                "precipitation_mm": _rounded_column(_pad_to(daily.get("precipitation_sum", []), n), 2),
+                "wind_speed_max_kmh": _rounded_column(_pad_to(daily.get("wind_speed_10m_max", []), n), 1),
+                "weather_code": pd.Series(weather_codes, dtype=object),
+                "weather": [_weather_description(code) for code in weather_codes],
+                "fetched_at": fetched_at
+            })
+    except Exception as e:
+        logger.warning(f"Failed to fetch forecast for {city['name']}: {e}")
+        mark_degraded(city['name'])
+        return None
+
+
 @demo_stream_bp.route('/weather/forecast', methods=['GET'])
 @limiter.limit(WEATHER_RATE_LIMIT)
+@http_cache(WEATHER_FORECAST_CACHE_TTL)
 def get_weather_forecast():
     """
     Multi-day weather forecast for US cities. Updates every few hours.
@@ -624,108 +1311,20 @@ def get_weather_forecast():
         cities_to_fetch = WEATHER_CITIES
     
     fetched_at = datetime.utcnow().isoformat() + "Z"
-    rows = []
     
-    for city in cities_to_fetch:
-        try:
-            if hourly_mode:
-                # Hourly forecast
-                params = {
-                    "latitude": city["lat"],
-                    "longitude": city["lon"],
-                    "hourly": "temperature_2m,relative_humidity_2m,wind_speed_10m,precipitation,weather_code,pressure_msl",
-                    "forecast_days": days,
-                    "timezone": "auto"
-                }
-                response = requests.get("https://api.open-meteo.com/v1/forecast", params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-                
-                hourly = data.get("hourly", {})
-                times = hourly.get("time", [])
-                temps = hourly.get("temperature_2m", [])
-                humidity = hourly.get("relative_humidity_2m", [])
-                wind = hourly.get("wind_speed_10m", [])
-                precip = hourly.get("precipitation", [])
-                weather_codes = hourly.get("weather_code", [])
-                pressure = hourly.get("pressure_msl", [])
-                
-                weather_desc = {
-                    0: "Clear", 1: "Mainly Clear", 2: "Partly Cloudy", 3: "Overcast",
-                    45: "Foggy", 48: "Depositing Rime Fog",
-                    51: "Light Drizzle", 53: "Moderate Drizzle", 55: "Dense Drizzle",
-                    61: "Slight Rain", 63: "Moderate Rain", 65: "Heavy Rain",
-                    71: "Slight Snow", 73: "Moderate Snow", 75: "Heavy Snow",
-                    80: "Slight Showers", 81: "Moderate Showers", 82: "Violent Showers",
-                    85: "Slight Snow Showers", 86: "Heavy Snow Showers",
-                    95: "Thunderstorm", 96: "Thunderstorm with Hail", 99: "Thunderstorm with Heavy Hail"
-                }
-                
-                for i, time_str in enumerate(times):
-                    code = weather_codes[i] if i < len(weather_codes) else 0
-                    rows.append({
-                        "city": city["name"],
-                        "state": city.get("state", ""),
-                        "timestamp": time_str,
-                        "temperature_c": round(temps[i], 1) if i < len(temps) and temps[i] is not None else None,
-                        "humidity_percent": humidity[i] if i < len(humidity) and humidity[i] is not None else None,
-                        "wind_speed_kmh": round(wind[i], 1) if i < len(wind) and wind[i] is not None else None,
-                        "precipitation_mm": round(precip[i], 2) if i < len(precip) and precip[i] is not None else None,
-                        "pressure_hpa": round(pressure[i], 1) if i < len(pressure) and pressure[i] is not None else None,
-                        "weather_code": code,
-                        "weather": weather_desc.get(code, "Unknown"),
-                        "fetched_at": fetched_at
-                    })
-            else:
-                # Daily forecast
-                params = {
-                    "latitude": city["lat"],
-                    "longitude": city["lon"],
-                    "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,wind_speed_10m_max,weather_code",
-                    "forecast_days": days,
-                    "timezone": "auto"
-                }
-                response = requests.get("https://api.open-meteo.com/v1/forecast", params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-                
-                daily = data.get("daily", {})
-                times = daily.get("time", [])
-                temp_max = daily.get("temperature_2m_max", [])
-                temp_min = daily.get("temperature_2m_min", [])
-                precip = daily.get("precipitation_sum", [])
-                wind = daily.get("wind_speed_10m_max", [])
-                weather_codes = daily.get("weather_code", [])
-                
-                weather_desc = {
-                    0: "Clear", 1: "Mainly Clear", 2: "Partly Cloudy", 3: "Overcast",
-                    45: "Foggy", 48: "Depositing Rime Fog",
-                    51: "Light Drizzle", 53: "Moderate Drizzle", 55: "Dense Drizzle",
-                    61: "Slight Rain", 63: "Moderate Rain", 65: "Heavy Rain",
-                    71: "Slight Snow", 73: "Moderate Snow", 75: "Heavy Snow",
-                    80: "Slight Showers", 81: "Moderate Showers", 82: "Violent Showers",
-                    85: "Slight Snow Showers", 86: "Heavy Snow Showers",
-                    95: "Thunderstorm", 96: "Thunderstorm with Hail", 99: "Thunderstorm with Heavy Hail"
-                }
-                
-                for i, time_str in enumerate(times):
-                    code = weather_codes[i] if i < len(weather_codes) else 0
-                    rows.append({
-                        "city": city["name"],
-                        "state": city.get("state", ""),
-                        "date": time_str,
-                        "temperature_max_c": round(temp_max[i], 1) if i < len(temp_max) and temp_max[i] is not None else None,
-                        "temperature_min_c": round(temp_min[i], 1) if i < len(temp_min) and temp_min[i] is not None else None,
-                        "precipitation_mm": round(precip[i], 2) if i < len(precip) and precip[i] is not None else None,
-                        "wind_speed_max_kmh": round(wind[i], 1) if i < len(wind) and wind[i] is not None else None,
-                        "weather_code": code,
-                        "weather": weather_desc.get(code, "Unknown"),
-                        "fetched_at": fetched_at
-                    })
-        except Exception as e:
-            logger.warning(f"Failed to fetch forecast for {city['name']}: {e}")
+    keep_open_meteo_warm(
+        ("forecast", days, hourly_mode, tuple(c["name"] for c in cities_to_fetch)),
+        [_forecast_params(city, days, hourly_mode) for city in cities_to_fetch],
+        OPEN_METEO_FORECAST_TTL, timeout=OPEN_METEO_FORECAST_TIMEOUT
+    )
     
-    return make_csv_response(rows)
+    frames = [frame for frame in _io_map(
+        lambda city: _fetch_city_forecast(city, days, hourly_mode, fetched_at),
+        cities_to_fetch) if frame is not None]
+    if not frames:
+        return make_csv_response([])
+    
+    return make_csv_response_df(pd.concat(frames, ignore_index=True))
 
 
 # ============================================================================
@@ -733,8 +1332,48 @@ def get_weather_forecast():
 # Recommended refresh: 300 seconds (5 minutes)
 # ============================================================================
 
+_WEATHER_TODAY_CURRENT = "temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m,precipitation,pressure_msl,cloud_cover,weather_code"
+
+
+def _fetch_city_weather_today(city: Dict[str, Any], fetched_at: str) -> Optional[Dict[str, Any]]:
+    """Fetch current conditions for a single city (runs on _IO_POOL)"""
+    try:
+        params = _current_weather_params(city, _WEATHER_TODAY_CURRENT)
+        data = cached_get_json(OPEN_METEO_FORECAST_URL, params, ttl=OPEN_METEO_CURRENT_TTL, timeout=OPEN_METEO_CURRENT_TIMEOUT)
+        current = data.get("current", {})
+        
+        weather_code = current.get("weather_code", 0)
+        temp = current.get("temperature_2m")
+        wind_speed = current.get("wind_speed_10m")
+        precip = current.get("precipitation")
+        pressure = current.get("pressure_msl")
+        
+        return {
+            "city": city["name"],
+            "state": city.get("state", ""),
+            "latitude": city["lat"],
+            "longitude": city["lon"],
+            "temperature_c": round(temp, 1) if temp is not None else None,
+            "temperature_f": round(temp * 9/5 + 32, 1) if temp is not None else None,
+            "humidity_percent": current.get("relative_humidity_2m"),
+            "wind_speed_kmh": round(wind_speed, 1) if wind_speed is not None else None,
+            "wind_direction_deg": current.get("wind_direction_10m"),
+            "precipitation_mm": round(precip, 2) if precip is not None else None,
+            "pressure_hpa": round(pressure, 1) if pressure is not None else None,
+            "cloud_cover_percent": current.get("cloud_cover"),
+            "weather_code": weather_code,
+            "weather": _weather_description(weather_code),
+            "fetched_at": fetched_at
+        }
+    except Exception as e:
+        logger.warning(f"Failed to fetch weather for {city['name']}: {e}")
+        mark_degraded(city['name'])
+        return None
+
+
 @demo_stream_bp.route('/weather/today', methods=['GET'])
 @limiter.limit(WEATHER_RATE_LIMIT)
+@http_cache(WEATHER_CACHE_TTL)
 def get_weather_today():
     """
     Today's current weather for multiple US cities - perfect for comparison.
@@ -765,53 +1404,16 @@ def get_weather_today():
         cities_to_fetch = WEATHER_CITIES[:limit]
     
     fetched_at = datetime.utcnow().isoformat() + "Z"
-    rows = []
     
-    for city in cities_to_fetch:
-        try:
-            params = {
-                "latitude": city["lat"],
-                "longitude": city["lon"],
-                "current": "temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m,precipitation,pressure_msl,cloud_cover,weather_code",
-                "timezone": "auto"
-            }
-            response = requests.get("https://api.open-meteo.com/v1/forecast", params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            current = data.get("current", {})
-            
-            weather_desc = {
-                0: "Clear", 1: "Mainly Clear", 2: "Partly Cloudy", 3: "Overcast",
-                45: "Foggy", 48: "Depositing Rime Fog",
-                51: "Light Drizzle", 53: "Moderate Drizzle", 55: "Dense Drizzle",
-                61: "Slight Rain", 63: "Moderate Rain", 65: "Heavy Rain",
-                71: "Slight Snow", 73: "Moderate Snow", 75: "Heavy Snow",
-                80: "Slight Showers", 81: "Moderate Showers", 82: "Violent Showers",
-                85: "Slight Snow Showers", 86: "Heavy Snow Showers",
-                95: "Thunderstorm", 96: "Thunderstorm with Hail", 99: "Thunderstorm with Heavy Hail"
-            }
-            
-            weather_code = current.get("weather_code", 0)
-            
-            rows.append({
-                "city": city["name"],
-                "state": city.get("state", ""),
-                "latitude": city["lat"],
-                "longitude": city["lon"],
-                "temperature_c": round(current.get("temperature_2m"), 1) if current.get("temperature_2m") is not None else None,
-                "temperature_f": round(current.get("temperature_2m") * 9/5 + 32, 1) if current.get("temperature_2m") is not None else None,
-                "humidity_percent": current.get("relative_humidity_2m"),
-                "wind_speed_kmh": round(current.get("wind_speed_10m"), 1) if current.get("wind_speed_10m") is not None else None,
-                "wind_direction_deg": current.get("wind_direction_10m"),
-                "precipitation_mm": round(current.get("precipitation"), 2) if current.get("precipitation") is not None else None,
-                "pressure_hpa": round(current.get("pressure_msl"), 1) if current.get("pressure_msl") is not None else None,
-                "cloud_cover_percent": current.get("cloud_cover"),
-                "weather_code": weather_code,
-                "weather": weather_desc.get(weather_code, "Unknown"),
-                "fetched_at": fetched_at
-            })
-        except Exception as e:
-            logger.warning(f"Failed to fetch weather for {city['name']}: {e}")
+    keep_open_meteo_warm(
+        ("weather_today", tuple(c["name"] for c in cities_to_fetch)),
+        [_current_weather_params(city, _WEATHER_TODAY_CURRENT) for city in cities_to_fetch],
+        OPEN_METEO_CURRENT_TTL
+    )
+    
+    # Fetch all cities concurrently; rows keep the order of cities_to_fetch
+    results = _io_map(lambda city: _fetch_city_weather_today(city, fetched_at), cities_to_fetch)
+    rows = [row for row in results if row is not None]
     
     return make_csv_response(rows)
 
@@ -858,39 +1460,98 @@ SP100_SYMBOLS = [
 
 
 # Helper functions for yfinance endpoints
-def _yf_is_valid(val):
-    """Check if value is valid (not NaN/None)"""
-    try:
-        return val is not None and not (isinstance(val, float) and math.isnan(val))
-    except:
-        return False
+def _yf_price_frame(symbol: str, hist: pd.DataFrame, fetched_at: str, intraday: bool = False) -> pd.DataFrame:
+    """Build one symbol's output columns from a yfinance price frame with vectorized ops"""
+    index = hist.index
+    columns = {"symbol": symbol}
+    if intraday:
+        # Intraday bars are exchange-local; report them in UTC
+        if index.tz is not None:
+            index = index.tz_convert('UTC')
+        columns["timestamp"] = index.strftime("%Y-%m-%d %H:%M:%S")
+    columns["date"] = index.strftime("%Y-%m-%d")
+    
+    prices = hist[["Open", "High", "Low", "Close"]].round(2)
+    columns.update({
+        "open": prices["Open"].to_numpy(),
+        "high": prices["High"].to_numpy(),
+        "low": prices["Low"].to_numpy(),
+        "close": prices["Close"].to_numpy(),
+        "volume": hist["Volume"].round().astype("Int64").to_numpy(),
+        "fetched_at": fetched_at
+    })
+    return pd.DataFrame(columns)
 
 
-def _yf_format_timestamp(date_obj):
-    """Convert pandas Timestamp or datetime to string"""
-    try:
-        if hasattr(date_obj, 'tz_convert'):
-            date_utc = date_obj.tz_convert('UTC')
-        elif hasattr(date_obj, 'tz_localize') and date_obj.tz is not None:
-            date_utc = date_obj.tz_convert('UTC')
-        else:
-            date_utc = date_obj
+def _yf_concat_sorted(frames: List[pd.DataFrame], sort_by: List[str]) -> pd.DataFrame:
+    """Concatenate per-symbol frames and sort them (stable, so bar order is kept on ties)"""
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True)
+    return df.sort_values(sort_by, kind="stable", ignore_index=True)
+
+
+# Ticker objects are reused across requests so their lazily fetched state (quote
+# summary behind ticker.info, exchange timezone) is not rebuilt on every call.
+# Entries expire so the memoized info does not go stale.
+_YF_TICKER_TTL = YFINANCE_FINANCIALS_CACHE_TTL
+_yf_tickers_lock = threading.Lock()
+_yf_tickers: Dict[str, Tuple[float, Any]] = {}  # symbol -> (expires_at monotonic, yf.Ticker)
+
+
+def _yf_ticker(symbol: str):
+    """Return a cached yf.Ticker for symbol, creating a fresh one once the cached one expires"""
+    now = time.monotonic()
+    with _yf_tickers_lock:
+        entry = _yf_tickers.get(symbol)
+        if entry is not None and entry[0] > now:
+            return entry[1]
         
-        if hasattr(date_utc, 'to_pydatetime'):
-            date_utc = date_utc.to_pydatetime()
-        elif hasattr(date_utc, 'timestamp'):
-            date_utc = datetime.fromtimestamp(date_utc.timestamp())
+        if entry is None:
+            # Symbols come from the query string; drop expired entries before growing the cache
+            for key in [k for k, (expires_at, _) in _yf_tickers.items() if expires_at <= now]:
+                del _yf_tickers[key]
         
-        if isinstance(date_utc, datetime):
-            return date_utc.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            return str(date_utc)
-    except:
-        return str(date_obj)
+        ticker = yf.Ticker(symbol)
+        _yf_tickers[symbol] = (now + _YF_TICKER_TTL, ticker)
+        return ticker
+
+
+def _yf_download(symbols: List[str], **kwargs) -> Dict[str, pd.DataFrame]:
+    """
+    Download price history for all symbols in one batched yf.download call
+    (yfinance fetches the symbols concurrently) and split it into per-symbol frames.
+    Symbols that returned no data are omitted.
+    """
+    data = yf.download(symbols, group_by='ticker', auto_adjust=True, actions=False,
+                       threads=True, progress=False, **kwargs)
+    frames = {}
+    if data is None or data.empty:
+        return frames
+    
+    if isinstance(data.columns, pd.MultiIndex):
+        available = set(data.columns.get_level_values(0))
+        per_symbol = [(symbol, data[symbol]) for symbol in symbols if symbol in available]
+    else:
+        per_symbol = [(symbols[0], data)] if len(symbols) == 1 else []
+    
+    for symbol, frame in per_symbol:
+        # Batched results share one index across symbols; drop the rows a symbol has no data for
+        frame = frame.dropna(how='all')
+        if not frame.empty:
+            frames[symbol] = frame
+    
+    missing = [symbol for symbol in symbols if symbol not in frames]
+    if missing:
+        logger.warning(f"No yfinance data returned for {', '.join(missing)}")
+        for symbol in missing:
+            mark_degraded(symbol)
+    return frames
 
 
 @demo_stream_bp.route('/yfinance/history', methods=['GET'])
 @limiter.limit(YFINANCE_RATE_LIMIT)
+@http_cache(YFINANCE_HISTORY_CACHE_TTL)
 def get_yfinance_history():
     """
     6-month daily stock price history via yfinance.
@@ -912,41 +1573,26 @@ def get_yfinance_history():
     start_date = now - timedelta(days=180)  # 6 months
     
     fetched_at = now.isoformat() + "Z"
-    rows = []
     
-    for symbol in symbols:
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(start=start_date.strftime("%Y-%m-%d"), end=now.strftime("%Y-%m-%d"))
-            
-            for date, row in hist.iterrows():
-                try:
-                    date_str = date.strftime("%Y-%m-%d") if hasattr(date, 'strftime') else str(date)
-                except:
-                    date_str = str(date)
-                
-                rows.append({
-                    "symbol": symbol,
-                    "date": date_str,
-                    "open": round(row["Open"], 2) if _yf_is_valid(row["Open"]) else None,
-                    "high": round(row["High"], 2) if _yf_is_valid(row["High"]) else None,
-                    "low": round(row["Low"], 2) if _yf_is_valid(row["Low"]) else None,
-                    "close": round(row["Close"], 2) if _yf_is_valid(row["Close"]) else None,
-                    "volume": int(row["Volume"]) if _yf_is_valid(row["Volume"]) else None,
-                    "fetched_at": fetched_at
-                })
-                    
-        except Exception as e:
-            logger.warning(f"Failed to fetch history for {symbol}: {e}")
+    try:
+        frames = _yf_download(symbols, start=start_date.strftime("%Y-%m-%d"), end=now.strftime("%Y-%m-%d"))
+    except Exception as e:
+        logger.warning(f"Failed to fetch history for {', '.join(symbols)}: {e}")
+        mark_degraded(",".join(symbols))
+        frames = {}
     
     # Sort by symbol, then date
-    rows.sort(key=lambda x: (x["symbol"], x["date"]))
+    df = _yf_concat_sorted(
+        [_yf_price_frame(symbol, hist, fetched_at) for symbol, hist in frames.items()],
+        ["symbol", "date"]
+    )
     
-    return make_csv_response(rows)
+    return make_csv_response_df(df)
 
 
 @demo_stream_bp.route('/yfinance/recent', methods=['GET'])
 @limiter.limit(YFINANCE_RATE_LIMIT)
+@http_cache(YFINANCE_RECENT_CACHE_TTL)
 def get_yfinance_recent():
     """
     Recent intraday stock prices (15-minute intervals) via yfinance.
@@ -967,42 +1613,61 @@ def get_yfinance_recent():
     
     now = datetime.utcnow()
     fetched_at = now.isoformat() + "Z"
-    rows = []
     
-    for symbol in symbols:
-        try:
-            ticker = yf.Ticker(symbol)
-            
-            # Get 5 days of 15-minute interval data
-            hist = ticker.history(interval='15m', period='5d')
-            
-            if not hist.empty:
-                for date, row in hist.iterrows():
-                    timestamp_str = _yf_format_timestamp(date)
-                    
-                    rows.append({
-                        "symbol": symbol,
-                        "timestamp": timestamp_str,
-                        "date": timestamp_str.split()[0] if ' ' in timestamp_str else str(date),
-                        "open": round(row["Open"], 2) if _yf_is_valid(row["Open"]) else None,
-                        "high": round(row["High"], 2) if _yf_is_valid(row["High"]) else None,
-                        "low": round(row["Low"], 2) if _yf_is_valid(row["Low"]) else None,
-                        "close": round(row["Close"], 2) if _yf_is_valid(row["Close"]) else None,
-                        "volume": int(row["Volume"]) if _yf_is_valid(row["Volume"]) else None,
-                        "fetched_at": fetched_at
-                    })
-                    
-        except Exception as e:
-            logger.warning(f"Failed to fetch recent data for {symbol}: {e}")
+    try:
+        # Get 5 days of 15-minute interval data
+        frames = _yf_download(symbols, interval='15m', period='5d')
+    except Exception as e:
+        logger.warning(f"Failed to fetch recent data for {', '.join(symbols)}: {e}")
+        mark_degraded(",".join(symbols))
+        frames = {}
     
     # Sort by symbol, then timestamp
-    rows.sort(key=lambda x: (x["symbol"], x["timestamp"]))
+    df = _yf_concat_sorted(
+        [_yf_price_frame(symbol, hist, fetched_at, intraday=True) for symbol, hist in frames.items()],
+        ["symbol", "timestamp"]
+    )
     
-    return make_csv_response(rows)
+    return make_csv_response_df(df)
+
+
+def _fetch_symbol_financials(symbol: str, fetched_at: str) -> Optional[Dict[str, Any]]:
+    """Fetch key financial metrics for a single symbol (runs on _YF_POOL)"""
+    try:
+        ticker = _yf_ticker(symbol)
+        info = ticker.info
+        
+        # Extract key financial metrics
+        return {
+            "symbol": symbol,
+            "name": info.get('shortName') or info.get('longName') or symbol,
+            "sector": info.get('sector') or 'N/A',
+            "industry": info.get('industry') or 'N/A',
+            "current_price": round(info.get('currentPrice') or info.get('regularMarketPrice') or 0, 2),
+            "previous_close": round(info.get('previousClose') or 0, 2),
+            "market_cap": info.get('marketCap') or 0,
+            "pe_ratio": round(info.get('trailingPE') or 0, 2) if info.get('trailingPE') else None,
+            "forward_pe": round(info.get('forwardPE') or 0, 2) if info.get('forwardPE') else None,
+            "eps": round(info.get('trailingEps') or 0, 2) if info.get('trailingEps') else None,
+            "dividend_yield": round((info.get('dividendYield') or 0) * 100, 2) if info.get('dividendYield') else 0,
+            "week_52_high": round(info.get('fiftyTwoWeekHigh') or 0, 2),
+            "week_52_low": round(info.get('fiftyTwoWeekLow') or 0, 2),
+            "avg_volume": info.get('averageVolume') or 0,
+            "beta": round(info.get('beta') or 0, 2) if info.get('beta') else None,
+            "profit_margin": round((info.get('profitMargins') or 0) * 100, 2) if info.get('profitMargins') else None,
+            "revenue": info.get('totalRevenue') or 0,
+            "fetched_at": fetched_at
+        }
+                
+    except Exception as e:
+        logger.warning(f"Failed to fetch financials for {symbol}: {e}")
+        mark_degraded(symbol)
+        return None
 
 
 @demo_stream_bp.route('/yfinance/financials', methods=['GET'])
 @limiter.limit(YFINANCE_RATE_LIMIT)
+@http_cache(YFINANCE_FINANCIALS_CACHE_TTL)
 def get_yfinance_financials():
     """
     Key financial metrics snapshot via yfinance for S&P 100 companies.
@@ -1027,37 +1692,9 @@ def get_yfinance_financials():
     
     now = datetime.utcnow()
     fetched_at = now.isoformat() + "Z"
-    rows = []
     
-    for symbol in symbols:
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            
-            # Extract key financial metrics
-            rows.append({
-                "symbol": symbol,
-                "name": info.get('shortName') or info.get('longName') or symbol,
-                "sector": info.get('sector') or 'N/A',
-                "industry": info.get('industry') or 'N/A',
-                "current_price": round(info.get('currentPrice') or info.get('regularMarketPrice') or 0, 2),
-                "previous_close": round(info.get('previousClose') or 0, 2),
-                "market_cap": info.get('marketCap') or 0,
-                "pe_ratio": round(info.get('trailingPE') or 0, 2) if info.get('trailingPE') else None,
-                "forward_pe": round(info.get('forwardPE') or 0, 2) if info.get('forwardPE') else None,
-                "eps": round(info.get('trailingEps') or 0, 2) if info.get('trailingEps') else None,
-                "dividend_yield": round((info.get('dividendYield') or 0) * 100, 2) if info.get('dividendYield') else 0,
-                "week_52_high": round(info.get('fiftyTwoWeekHigh') or 0, 2),
-                "week_52_low": round(info.get('fiftyTwoWeekLow') or 0, 2),
-                "avg_volume": info.get('averageVolume') or 0,
-                "beta": round(info.get('beta') or 0, 2) if info.get('beta') else None,
-                "profit_margin": round((info.get('profitMargins') or 0) * 100, 2) if info.get('profitMargins') else None,
-                "revenue": info.get('totalRevenue') or 0,
-                "fetched_at": fetched_at
-            })
-                    
-        except Exception as e:
-            logger.warning(f"Failed to fetch financials for {symbol}: {e}")
+    results = _io_map(lambda symbol: _fetch_symbol_financials(symbol, fetched_at), symbols, pool=_YF_POOL)
+    rows = [row for row in results if row is not None]
     
     # Sort by symbol
     rows.sort(key=lambda x: x["symbol"])
@@ -1073,11 +1710,18 @@ def get_yfinance_financials():
 
 # Thread-safe storage for sales transaction history
 _sales_lock = threading.Lock()
-_sales_history: deque = deque(maxlen=1000)  # Keep last 1000 transactions
-_sales_last_update: Optional[datetime] = None
+_sales_history: deque = deque(maxlen=1000)  # Keep last 1000 transactions, as tuples in _SALES_COLUMNS order
+_sales_last_update_mono: Optional[float] = None  # time.monotonic() of the last generated batch
+_sales_last_batch_ms: Optional[int] = None       # Epoch milliseconds the last batch was generated at
 
-# Products with realistic pricing and popularity
-_SALES_PRODUCTS = [
+_SALES_COLUMNS = (
+    "transaction_id", "timestamp", "product", "category", "quantity", "unit_price",
+    "discount_pct", "total", "region", "channel", "fetched_at",
+)
+
+# Products with realistic pricing and popularity. The catalogue and weights
+# below are fixed, so they live here as tuples rather than being rebuilt per request.
+_SALES_PRODUCTS = (
     {"name": "Wireless Headphones", "category": "Electronics", "base_price": 79.99, "popularity": 0.15},
     {"name": "Smart Watch", "category": "Electronics", "base_price": 199.99, "popularity": 0.10},
     {"name": "Running Shoes", "category": "Sports", "base_price": 129.99, "popularity": 0.12},
@@ -1088,168 +1732,261 @@ _SALES_PRODUCTS = [
     {"name": "Water Bottle", "category": "Accessories", "base_price": 24.99, "popularity": 0.13},
     {"name": "Bluetooth Speaker", "category": "Electronics", "base_price": 49.99, "popularity": 0.08},
     {"name": "Fitness Tracker", "category": "Electronics", "base_price": 69.99, "popularity": 0.07},
-]
+)
+_SALES_PRODUCT_WEIGHTS = tuple(p["popularity"] for p in _SALES_PRODUCTS)
+_SALES_PRODUCT_NAMES = tuple(p["name"] for p in _SALES_PRODUCTS)
+_SALES_PRODUCT_CATEGORIES = tuple(p["category"] for p in _SALES_PRODUCTS)
 
-_SALES_REGIONS = ["North America", "Europe", "Asia Pacific", "Latin America"]
-_SALES_REGION_WEIGHTS = [0.45, 0.30, 0.18, 0.07]
+_SALES_REGIONS = ("North America", "Europe", "Asia Pacific", "Latin America")
+_SALES_REGION_WEIGHTS = (0.45, 0.30, 0.18, 0.07)
 
-_SALES_CHANNELS = ["Web", "Mobile App", "In-Store", "Partner"]
-_SALES_CHANNEL_WEIGHTS = [0.40, 0.35, 0.15, 0.10]
+_SALES_CHANNELS = ("Web", "Mobile App", "In-Store", "Partner")
+_SALES_CHANNEL_WEIGHTS = (0.40, 0.35, 0.15, 0.10)
 
+_SALES_QUANTITIES = (1, 2, 3, 4, 5)
+_SALES_QUANTITY_WEIGHTS = (0.5, 0.25, 0.15, 0.07, 0.03)
 
-def _generate_sale_transaction(timestamp: datetime) -> Dict[str, Any]:
-    """Generate a single sale transaction"""
-    product = random.choices(_SALES_PRODUCTS, weights=[p["popularity"] for p in _SALES_PRODUCTS])[0]
-    region = random.choices(_SALES_REGIONS, weights=_SALES_REGION_WEIGHTS)[0]
-    channel = random.choices(_SALES_CHANNELS, weights=_SALES_CHANNEL_WEIGHTS)[0]
-    
-    quantity = random.choices([1, 2, 3, 4, 5], weights=[0.5, 0.25, 0.15, 0.07, 0.03])[0]
-    discount = random.choices([0, 5, 10, 15, 20], weights=[0.6, 0.15, 0.12, 0.08, 0.05])[0]
+_SALES_DISCOUNTS = (0, 5, 10, 15, 20)
+_SALES_DISCOUNT_WEIGHTS = (0.6, 0.15, 0.12, 0.08, 0.05)
+
+
+def _build_alias(weights) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    Build a Walker alias table (Vose's construction) for a fixed discrete distribution.
     
-    unit_price = round(product["base_price"] * (1 - discount / 100), 2)
-    total = round(unit_price * quantity, 2)
+    Returns (prob, alias): slot i yields outcome i with probability prob[i], otherwise
+    outcome alias[i]. Drawing then costs one uniform and one comparison, whatever the
+    number of outcomes.
+    """
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] += scaled[less] - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Whatever is left is (up to rounding) exactly full and keeps prob 1.0
+    return tuple(prob), tuple(alias)
+
+
+def _alias_table(weights) -> Tuple[np.ndarray, np.ndarray]:
+    """Alias table as NumPy arrays, for vectorized sampling (float32 is ample precision for demo weights)"""
+    prob, alias = _build_alias(weights)
+    return np.array(prob, dtype=np.float32), np.array(alias, dtype=np.intp)
+
+
+# The feed's own generator (seeded from OS entropy), so it shares no state with the
+# process-wide `random` instance. Generators are not thread-safe; this one is only
+# used under _sales_lock, which already serializes every writer.
+_sales_rng = np.random.default_rng()
+
+_SALES_MAX_BATCH = 10  # Largest batch ever generated (the initial one)
+
+# Uniforms for one batch: a row per transaction, a column per sampled attribute. Filled
+# in place by a single generator call per batch; like _sales_rng, only used under _sales_lock.
+_sales_uniforms = np.empty((_SALES_MAX_BATCH, 5), dtype=np.float32)
+
+
+def _alias_sample(table: Tuple[np.ndarray, np.ndarray], uniforms: np.ndarray) -> np.ndarray:
+    """Map uniforms in [0, 1) to outcome indices of an alias table in one vectorized pass"""
+    prob, alias = table
+    # The integer part of each scaled uniform picks the slot, the fraction decides slot vs alias
+    u = uniforms * np.float32(len(prob))
+    # float32 rounding can carry u just below len(prob) up to it; keep the slot in range
+    slots = np.minimum(u.astype(np.intp), len(prob) - 1)
+    return np.where(u - slots < prob[slots], slots, alias[slots])
+
+
+# The distributions are static, so their alias tables are built (and the weights
+# normalized) once at import; sampling never re-sums them
+_SALES_PRODUCT_ALIAS = _alias_table(_SALES_PRODUCT_WEIGHTS)
+_SALES_REGION_ALIAS = _alias_table(_SALES_REGION_WEIGHTS)
+_SALES_CHANNEL_ALIAS = _alias_table(_SALES_CHANNEL_WEIGHTS)
+_SALES_QUANTITY_ALIAS = _alias_table(_SALES_QUANTITY_WEIGHTS)
+_SALES_DISCOUNT_ALIAS = _alias_table(_SALES_DISCOUNT_WEIGHTS)
+
+# Per-outcome values as arrays, so whole columns are gathered by index
+_SALES_QUANTITY_VALUES = np.array(_SALES_QUANTITIES)
+_SALES_DISCOUNT_VALUES = np.array(_SALES_DISCOUNTS)
+
+# Every (product, discount[, quantity]) combination is known up front, so prices are
+# rounded once here and looked up per transaction
+_SALES_UNIT_PRICES = np.array([
+    [round(p["base_price"] * (1 - d / 100), 2) for d in _SALES_DISCOUNTS]
+    for p in _SALES_PRODUCTS
+])
+_SALES_TOTALS = np.array([
+    [[round(unit_price * q, 2) for q in _SALES_QUANTITIES] for unit_price in row]
+    for row in _SALES_UNIT_PRICES.tolist()
+])
+
+
+@lru_cache(maxsize=128)
+def _iso_second(epoch_s: int) -> str:
+    """Whole-second part of the ISO timestamp for integer epoch seconds"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_s))
+
+
+def _iso_from_epoch_us(epoch_us: int) -> str:
+    """Format integer epoch microseconds like datetime.isoformat() + "Z" (fraction only when non-zero)"""
+    seconds, micros = divmod(epoch_us, 1_000_000)
+    # A batch only spans a handful of distinct seconds (at most 61), shared with its
+    # fetched_at and with the previous batch, so each second is formatted once
+    base = _iso_second(seconds)
+    return f"{base}.{micros:06d}Z" if micros else base + "Z"
+
+
+def _generate_sale_transactions(now_us: int, offsets_ms: List[int], fetched_at: str) -> List[tuple]:
+    """
+    Generate one sale transaction per offset (milliseconds before `now_us`, integer epoch
+    microseconds), computing each column for the whole batch at once.
+    """
+    n = len(offsets_ms)
+    # One generator call covers every attribute of every transaction in the batch
+    uniforms = _sales_uniforms[:n]
+    _sales_rng.random(dtype=np.float32, out=uniforms)
+    product_idx = _alias_sample(_SALES_PRODUCT_ALIAS, uniforms[:, 0])
+    region_idx = _alias_sample(_SALES_REGION_ALIAS, uniforms[:, 1])
+    channel_idx = _alias_sample(_SALES_CHANNEL_ALIAS, uniforms[:, 2])
+    quantity_idx = _alias_sample(_SALES_QUANTITY_ALIAS, uniforms[:, 3])
+    discount_idx = _alias_sample(_SALES_DISCOUNT_ALIAS, uniforms[:, 4])
+    
+    quantities = _SALES_QUANTITY_VALUES[quantity_idx]
+    discounts = _SALES_DISCOUNT_VALUES[discount_idx]
+    unit_prices = _SALES_UNIT_PRICES[product_idx, discount_idx]
+    totals = _SALES_TOTALS[product_idx, discount_idx, quantity_idx]
+    
+    # Back to Python scalars for the row tuples (and their CSV formatting)
+    now_ms = now_us // 1000
+    transactions = []
+    for offset_ms, p, r, c, quantity, discount, unit_price, total in zip(
+            offsets_ms, product_idx.tolist(), region_idx.tolist(), channel_idx.tolist(),
+            quantities.tolist(), discounts.tolist(), unit_prices.tolist(), totals.tolist()):
+        transactions.append((
+            f"TX{(now_ms - offset_ms) % 100000000:08d}",
+            _iso_from_epoch_us(now_us - offset_ms * 1000),
+            _SALES_PRODUCT_NAMES[p],
+            _SALES_PRODUCT_CATEGORIES[p],
+            quantity,
+            unit_price,
+            discount,
+            total,
+            _SALES_REGIONS[r],
+            _SALES_CHANNELS[c],
+            fetched_at,
+        ))
+    return transactions
+
+
+_SALES_UPDATE_INTERVAL = 1  # Seconds between generated batches (background refresher cadence)
+_SALES_STALE_AFTER = 3       # Requests generate inline only when the last batch is this old
+_SALES_IDLE_TIMEOUT = 60     # Stop generating this long after the last /live-sales request
+
+
+def _sales_due(now_mono: float, min_age: float) -> bool:
+    """Whether the last generated batch is at least min_age seconds old"""
+    last_update = _sales_last_update_mono
+    return last_update is None or now_mono - last_update >= min_age
+
+
+def _sales_tick(min_age: float) -> None:
+    """Append the next batch of transactions if the last one is at least min_age seconds old"""
+    global _sales_last_update_mono, _sales_last_batch_ms
+    
+    # Cheap unlocked check first; the lock only serializes writers
+    if not _sales_due(time.monotonic(), min_age):
+        return
     
-    return {
-        "transaction_id": f"TX{int(timestamp.timestamp() * 1000) % 100000000:08d}",
-        "timestamp": timestamp.isoformat() + "Z",
-        "product": product["name"],
-        "category": product["category"],
-        "quantity": quantity,
-        "unit_price": unit_price,
-        "discount_pct": discount,
-        "total": total,
-        "region": region,
-        "channel": channel,
-    }
+    with _sales_lock:
+        now_mono = time.monotonic()
+        if not _sales_due(now_mono, min_age):
+            return
+        
+        # Wall-clock time is only needed for the generated transactions' ids and timestamps,
+        # which are all integer arithmetic on epoch time; no datetime objects are built
+        now_us = time.time_ns() // 1000
+        fetched_at = _iso_from_epoch_us(now_us)
+        
+        # Offsets are sorted largest first so each batch comes out oldest to newest.
+        # Each batch spans at most the time since the previous one (capped at a second),
+        # so the history stays in timestamp order without ever being re-sorted.
+        now_ms = now_us // 1000
+        if len(_sales_history) == 0:
+            # Generate 5-10 initial transactions over the last minute
+            num_initial = int(_sales_rng.integers(5, _SALES_MAX_BATCH + 1))
+            offsets_ms = sorted((_sales_rng.integers(0, 61, size=num_initial) * 1000).tolist(), reverse=True)
+        else:
+            # Generate 1-3 new transactions per update, spread over the last second
+            num_new_transactions = int(_sales_rng.integers(1, 4))
+            span_ms = min(1000, max(0, now_ms - _sales_last_batch_ms))
+            offsets_ms = sorted(_sales_rng.integers(0, span_ms + 1, size=num_new_transactions).tolist(), reverse=True)
+        
+        _sales_history.extend(_generate_sale_transactions(now_us, offsets_ms, fetched_at))
+        
+        _sales_last_update_mono = now_mono
+        _sales_last_batch_ms = now_ms
+
+
+def _sales_tick_in_background() -> None:
+    """Refresher job: add the next batch"""
+    # The refresher already spaces these runs an interval apart, so min_age only needs to
+    # skip one that lands right after an inline batch; requiring the full interval would
+    # drop a whole cycle whenever the wakeup runs a little early.
+    _sales_tick(_SALES_UPDATE_INTERVAL / 2)
 
 
 @demo_stream_bp.route('/live-sales', methods=['GET'])
 @limiter.limit(MOCK_RATE_LIMIT)
+@http_cache(LIVE_SALES_CACHE_TTL)
 def get_live_sales():
     """
     Simulated live sales feed with accumulating transaction history.
     Data accumulates in memory and maintains a rolling record of the last 1000 transactions.
-    Each refresh may add new transactions and returns the complete accumulated dataset.
+    While the feed is being polled, the background refresher adds a batch of transactions
+    about once a second; a request adds one itself if the last batch is 3 seconds old.
     
     Query params:
         - limit: Maximum number of records to return (default: 1000, max: 1000)
     
     Recommended refresh: 1-5 seconds
     """
-    global _sales_last_update
-    
-    now = datetime.utcnow()
     limit = min(1000, max(1, int(request.args.get('limit', 1000))))
     
-    # Generate new transactions if enough time has passed (at least 1 second)
-    with _sales_lock:
-        should_update = _sales_last_update is None or (now - _sales_last_update).total_seconds() >= 1
-        
-        if should_update:
-            # If no data exists yet, generate initial batch of transactions
-            if len(_sales_history) == 0:
-                # Generate 5-10 initial transactions
-                num_initial = random.randint(5, 10)
-                for _ in range(num_initial):
-                    tx_time = now - timedelta(seconds=random.randint(0, 60))
-                    transaction = _generate_sale_transaction(tx_time)
-                    transaction["fetched_at"] = now.isoformat() + "Z"
-                    _sales_history.append(transaction)
-            else:
-                # Generate 1-3 new transactions per update
-                num_new_transactions = random.randint(1, 3)
-                for _ in range(num_new_transactions):
-                    # Spread transactions over the last second
-                    tx_time = now - timedelta(milliseconds=random.randint(0, 1000))
-                    transaction = _generate_sale_transaction(tx_time)
-                    transaction["fetched_at"] = now.isoformat() + "Z"
-                    _sales_history.append(transaction)
-            
-            _sales_last_update = now
-        
-        # Return all accumulated records (up to limit)
-        rows = list(_sales_history)[-limit:]
+    # The background refresher generates transactions while the feed is in demand;
+    # generate inline only on a cold start or if the refresher has fallen behind
+    keep_warm(("live_sales",), _SALES_UPDATE_INTERVAL, _sales_tick_in_background, idle_timeout=_SALES_IDLE_TIMEOUT)
+    _sales_tick(_SALES_STALE_AFTER)
     
-    # Sort by timestamp descending (most recent first)
-    rows.sort(key=lambda x: x["timestamp"], reverse=True)
+    # Readers don't take the lock: the deque is only ever appended to, and
+    # copying it with list() runs entirely in C, so under CPython's GIL the
+    # snapshot is atomic with respect to concurrent appends.
+    rows = list(_sales_history)
+    # Trim the snapshot in place rather than slicing a second list out of it
+    del rows[:-limit]
     
-    return make_csv_response(rows)
+    # History is kept oldest first; serve most recent first
+    rows.reverse()
+    
+    return make_csv_response_rows(_SALES_COLUMNS, rows)
 
 
 # ============================================================================
 # API Info Endpoint
 # ============================================================================
 
+# Static description of the demo endpoints, kept in demo_info.json next to this module.
+# It never changes, so it is parsed and re-serialized once at import (compact, keys in
+# file order, like jsonify with the app's sort_keys = False) and /info just returns the bytes.
+_INFO_BODY = orjson.dumps(orjson.loads((Path(__file__).parent / "demo_info.json").read_bytes()))
+
+
 @demo_stream_bp.route('/info', methods=['GET'])
 def get_info():
     """List all available demo data endpoints with their parameters"""
-    return jsonify({
-        "name": "Demo Data REST APIs",
-        "description": "Each endpoint returns CSV text with complete datasets that change over time. "
-                       "Import URL in frontend, set auto-refresh to watch data evolve.",
-        "design_philosophy": [
-            "Each endpoint returns a COMPLETE dataset (not just one row)",
-            "Datasets are meaningful for analysis and visualization", 
-            "When refreshed, new data may appear (accumulating) or values may update",
-            "Use date parameters to track data from a specific point in time"
-        ],
-        "demo_examples": [
-            # Stock Market Data - History, Intraday, and Financials
-            {
-                "id": "stocks-history",
-                "url": "/api/demo-stream/yfinance/history?symbols=AAPL,MSFT,GOOGL,AMZN,META,NVDA",
-                "name": "📈 Yahoo Finance: 6-Month Stock Price History - Tech Companies (updates daily)",
-                "refresh_seconds": 86400,
-            },
-            {
-                "id": "stocks-intraday",
-                "url": "/api/demo-stream/yfinance/recent?symbols=AAPL,MSFT,GOOGL,AMZN,META,NVDA,TSLA",
-                "name": "📈 Yahoo Finance: Recent Intraday Stock Prices - Tech Companies (updates every 15 min)",
-                "refresh_seconds": 900,
-            },
-            {
-                "id": "stocks-financials",
-                "url": "/api/demo-stream/yfinance/financials",
-                "name": "📈 Yahoo Finance: S&P 100 Key Financial Metrics (updates daily)",
-                "refresh_seconds": 86400,
-            },
-            # ISS Tracking Variations
-            {
-                "id": "iss-trajectory-recent",
-                "url": "/api/demo-stream/iss",
-                "name": "🛰️ Open Notify: International Space Station Real-time Positions (updates every 30 sec)",
-                "refresh_seconds": 30,
-            },
-            
-            # Earthquake Data Variations
-            {
-                "id": "earthquakes-significant-week",
-                "url": "/api/demo-stream/earthquakes?timeframe=week&min_magnitude=4",
-                "name": "🌍 USGS: Significant Earthquakes Worldwide - Last Week (updates every minute)",
-                "refresh_seconds": 60,
-            },
-
-            # Weather Data Variations
-            {
-                "id": "weather-today-all-cities",
-                "url": "/api/demo-stream/weather/today",
-                "name": "🌤️ Open Meteo: Today's Weather - 20 Major US Cities (updates daily)",
-                "refresh_seconds": 86400,
-            },
-            {
-                "id": "weather-forecast-hourly",
-                "url": "/api/demo-stream/weather/forecast?days=3&hourly=true",
-                "name": "🌤️ Open Meteo: 3-Day Hourly Weather Forecast - US Cities (updates hourly)",
-                "refresh_seconds": 3600,
-            },
-            
-            # Live Sales & E-commerce Variations
-            {
-                "id": "live-sales-feed",
-                "url": "/api/demo-stream/live-sales",
-                "name": "💰 Simulated: Live E-commerce Sales Feed (updates every 5 seconds)",
-                "refresh_seconds": 5,
-            }
-        ],
-        "usage": "Click any example to load it, or enter a custom URL. Set auto-refresh to watch data change over time."
-    })
+    return Response(_INFO_BODY, mimetype='application/json')